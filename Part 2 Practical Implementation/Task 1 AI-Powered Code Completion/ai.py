@@ -1,3 +1,6 @@
+import operator
+
+
 def sort_list_of_dicts_ai(data, key):
     """
     Sorts a list of dictionaries by a specific key.
@@ -9,20 +12,25 @@ def sort_list_of_dicts_ai(data, key):
     Returns:
         list: Sorted list
     """
-    return sorted(data, key=lambda x: x[key])
+    return sorted(data, key=operator.itemgetter(key))
 
 def sort_list_of_dicts_multikey(data, keys):
     """Sort by multiple keys"""
-    return sorted(data, key=lambda x: tuple(x[k] for k in keys))
+    if not keys:
+        return list(data)
+    # itemgetter builds the key tuple in C (a scalar for a single key,
+    # which orders the same as a 1-tuple)
+    return sorted(data, key=operator.itemgetter(*keys))
 
 def sort_list_of_dicts_nested(data, key_path):
     """Sort by nested key using path like 'user.profile.age'"""
-    def get_nested_value(item, path):
-        keys = path.split('.')
+    # Split the path once rather than for every item
+    keys = tuple(key_path.split('.'))
+    def get_nested_value(item):
         for k in keys:
             item = item[k]
         return item
-    return sorted(data, key=lambda x: get_nested_value(x, key_path))
+    return sorted(data, key=get_nested_value)
 
 # Test data
 test_data = [
@@ -1,12 +1,13 @@
 import timeit
-import random
+import numpy as np
 from manual import sort_list_of_dicts_manual
 from Ai import sort_list_of_dicts_ai
 
-# Generate large test dataset
+# Generate large test dataset (values drawn in one vectorized call)
+values = np.random.randint(1, 1001, size=10000).tolist()
 large_data = [
-    {'id': i, 'value': random.randint(1, 1000), 'name': f'item_{i}'} 
-    for i in range(10000)
+    {'id': i, 'value': v, 'name': f'item_{i}'} 
+    for i, v in enumerate(values)
 ]
 
 # Performance testing
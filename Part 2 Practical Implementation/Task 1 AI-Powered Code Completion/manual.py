@@ -1,10 +1,14 @@
-def sort_list_of_dicts_manual(data, key):
+import operator
+
+
+def sort_list_of_dicts_manual(data, key, reverse=False):
     """
     Sorts a list of dictionaries by a specified key using AI-generated logic.
     
     Args:
         data (list): List of dictionaries to sort
         key (str): Key to sort by
+        reverse (bool): Sort in descending order
     
     Returns:
         list: Sorted list of dictionaries
@@ -12,15 +16,16 @@ def sort_list_of_dicts_manual(data, key):
     if not data:
         return []
     
-    # Validate that key exists in all dictionaries
-    if not all(key in item for item in data):
-        missing_keys = [i for i, item in enumerate(data) if key not in item]
-        raise KeyError(f"Key '{key}' missing in items: {missing_keys}")
+    get_key = operator.itemgetter(key)
     
     try:
         # Sort the data using the specified key
-        sorted_data = sorted(data, key=lambda x: x[key])
+        sorted_data = sorted(data, key=get_key, reverse=reverse)
         return sorted_data
+    except KeyError as e:
+        # Only scan for the offending items once the sort has failed
+        missing_keys = [i for i, item in enumerate(data) if key not in item]
+        raise KeyError(f"Key '{key}' missing in items: {missing_keys}") from e
     except TypeError as e:
         raise TypeError(f"Cannot sort by key '{key}': {str(e)}")
 
@@ -31,9 +36,10 @@ test_data = [
     {'name': 'Charlie', 'age': 35, 'score': 78}
 ]
 # Test cases
-print("Original:", test_data)
-print("Sorted by age:", sort_list_of_dicts_manual(test_data, 'age'))
-print("Sorted by score:", sort_list_of_dicts_manual(test_data, 'score'))
-print("Sorted by score (desc):", sort_list_of_dicts_manual(test_data, 'score')[::-1])
-# Edge case: empty list
-print("Empty list:", sort_list_of_dicts_manual([], 'age'))
\ No newline at end of file
+if __name__ == "__main__":
+    print("Original:", test_data)
+    print("Sorted by age:", sort_list_of_dicts_manual(test_data, 'age'))
+    print("Sorted by score:", sort_list_of_dicts_manual(test_data, 'score'))
+    print("Sorted by score (desc):", sort_list_of_dicts_manual(test_data, 'score', reverse=True))
+    # Edge case: empty list
+    print("Empty list:", sort_list_of_dicts_manual([], 'age'))
\ No newline at end of file
@@ -1,9 +1,16 @@
+# selenium_test_script.py
+# Run serially:      python selenium_test_script.py
+# Run in parallel:   pytest -n 3 selenium_test_script.py
+# (requires the packages in requirements-test.txt). Tests share no state
+# across processes: each pytest-xdist worker runs setUpClass and gets its
+# own Chrome driver.
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.chrome.options import Options
+from concurrent.futures import ThreadPoolExecutor
 import unittest
 import time
 import logging
@@ -11,8 +18,9 @@ import logging
 class TestLoginPageAIEnhanced(unittest.TestCase):
     """AI-enhanced automated testing for login functionality"""
     
-    def setUp(self):
-        """Initialize driver with optimized configuration"""
+    @classmethod
+    def setUpClass(cls):
+        """Initialize one driver with optimized configuration for all tests"""
         chrome_options = Options()
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -21,21 +29,63 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.wait = WebDriverWait(self.driver, 20)  # Increased timeout
-        self.base_url = "https://aura-pro-plus.onrender.com/auth/login"  
-        self.logger = logging.getLogger('LoginTests')
+        # Run headless and skip image downloads; stylesheets stay enabled because
+        # is_displayed() checks on error messages depend on CSS visibility rules
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+        
+        cls.driver = webdriver.Chrome(options=chrome_options)
+        cls.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        cls.driver.set_page_load_timeout(20)
+        cls.wait = WebDriverWait(cls.driver, 20)  # Increased timeout
+        cls.base_url = "https://aura-pro-plus.onrender.com/auth/login"  
+        cls.logger = logging.getLogger('LoginTests')
         
-    def tearDown(self):
-        """Clean up after tests"""
-        if self.driver:
-            self.driver.quit()
+        # Screenshots are written to disk in the background
+        cls.screenshot_pool = ThreadPoolExecutor(max_workers=2)
+        cls.screenshot_futures = []
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests"""
+        if cls.driver:
+            cls.driver.quit()
+        
+        # Make sure every pending screenshot reaches the disk
+        for future in cls.screenshot_futures:
+            try:
+                future.result()
+            except Exception as e:
+                cls.logger.warning(f"Could not write screenshot: {str(e)}")
+        cls.screenshot_pool.shutdown()
+    
+    def setUp(self):
+        """Reset browser state so each test starts logged out"""
+        self.driver.delete_all_cookies()
+        try:
+            self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            # Storage is not accessible before the first page has been loaded
+            pass
+    
+    @staticmethod
+    def write_screenshot(filename, png_bytes):
+        """Write captured PNG bytes to disk"""
+        with open(filename, 'wb') as f:
+            f.write(png_bytes)
     
     def safe_screenshot(self, name):
         """Safe screenshot utility with timeout handling"""
         try:
-            self.driver.save_screenshot(f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.png")
+            png_bytes = self.driver.get_screenshot_as_png()
+            filename = f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.png"
+            self.screenshot_futures.append(
+                self.screenshot_pool.submit(self.write_screenshot, filename, png_bytes)
+            )
             return True
         except Exception as e:
             self.logger.warning(f"Could not take screenshot {name}: {str(e)}")
@@ -46,25 +96,52 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
         for attempt in range(max_retries):
             try:
                 self.driver.get(url)
-                time.sleep(5)  # Base wait time
+                # Return as soon as the document has finished loading
+                self.wait.until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
                 return True
             except Exception as e:
                 self.logger.warning(f"Page load attempt {attempt + 1} failed: {str(e)}")
                 if attempt < max_retries - 1:
-                    time.sleep(10)  # Wait longer between retries
+                    time.sleep(min(0.5 * 2 ** attempt, 3))  # Exponential backoff, capped at 3s
                     continue
                 else:
                     raise e
     
-    def find_element_with_fallback(self, selectors):
-        """Try multiple selectors to find element"""
+    def combine_selectors(self, selectors):
+        """Merge multiple selectors into a single XPath union locator (matches in document order)"""
+        xpaths = []
         for by, value in selectors:
-            try:
-                element = self.wait.until(EC.presence_of_element_located((by, value)))
-                return element
-            except TimeoutException:
-                continue
-        raise NoSuchElementException(f"Element not found with any selector: {selectors}")
+            if by == By.XPATH:
+                xpaths.append(value)
+            elif by == By.ID:
+                xpaths.append(f"//*[@id='{value}']")
+            elif by == By.NAME:
+                xpaths.append(f"//*[@name='{value}']")
+            elif by == By.CLASS_NAME:
+                xpaths.append(f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]")
+            elif by == By.TAG_NAME:
+                xpaths.append(f"//{value}")
+            else:
+                raise ValueError(f"Unsupported selector strategy: {by}")
+        return (By.XPATH, " | ".join(xpaths))
+    
+    def find_element_with_fallback(self, selectors):
+        """Find an element with the highest-priority matching selector in one wait"""
+        def first_matching_selector(driver):
+            # Try selectors in list order on every poll, so a broad fallback
+            # (e.g. any 'Login' button) never wins over a more specific match
+            for by, value in selectors:
+                elements = driver.find_elements(by, value)
+                if elements:
+                    return elements[0]
+            return False
+        
+        try:
+            return self.wait.until(first_matching_selector)
+        except TimeoutException:
+            raise NoSuchElementException(f"Element not found with any selector: {selectors}")
     
     def test_valid_login(self):
         """Test successful login with valid credentials"""
@@ -105,6 +182,16 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
             password_field = self.find_element_with_fallback(password_selectors)
             login_button = self.find_element_with_fallback(button_selectors)
             
+            # Indicators that the user reached an authenticated page
+            success_indicators = [
+                (By.XPATH, "//*[contains(text(), 'Welcome')]"),
+                (By.XPATH, "//*[contains(text(), 'Dashboard')]"),
+                (By.XPATH, "//*[contains(text(), 'Logout')]"),
+                (By.CLASS_NAME, "dashboard"),
+                (By.ID, "dashboard"),
+                (By.XPATH, "//*[contains(text(), 'Profile')]")
+            ]
+            
             # Clear fields and enter credentials
             username_field.clear()
             password_field.clear()
@@ -114,39 +201,36 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
             # Take screenshot with credentials entered
             self.safe_screenshot("valid_login_credentials_entered")
             
-            time.sleep(2)  # Small delay before click
+            self.wait.until(EC.element_to_be_clickable(login_button))
+            # Compare against the URL right before submitting, not base_url,
+            # so a redirect during page load doesn't end the wait early
+            url_before_submit = self.driver.current_url
             login_button.click()
             
-            # Wait for login to process with longer timeout
-            time.sleep(8)
+            # Wait for login to process: the page navigates away or the form is re-rendered
+            try:
+                WebDriverWait(self.driver, 8).until(EC.any_of(
+                    EC.url_changes(url_before_submit),
+                    EC.staleness_of(login_button)
+                ))
+            except TimeoutException:
+                pass
             
             # Take screenshot after login attempt
             self.safe_screenshot("valid_login_after_submit")
             
-            # Check for successful login indicators with shorter timeout
-            success_indicators = [
-                (By.XPATH, "//*[contains(text(), 'Welcome')]"),
-                (By.XPATH, "//*[contains(text(), 'Dashboard')]"),
-                (By.XPATH, "//*[contains(text(), 'Logout')]"),
-                (By.CLASS_NAME, "dashboard"),
-                (By.ID, "dashboard"),
-                (By.XPATH, "//*[contains(text(), 'Profile')]")
-            ]
-            
-            # Try to find any success indicator quickly
+            # Wait once for whichever success indicator appears first
             success_found = False
-            for by, value in success_indicators:
-                try:
-                    # Use shorter timeout for success checks
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((by, value))
-                    )
-                    success_found = True
-                    self.logger.info(f"Valid login test: PASSED - Found success indicator: {value}")
-                    self.safe_screenshot("valid_login_success")
-                    break
-                except TimeoutException:
-                    continue
+            try:
+                # Use shorter timeout for success checks
+                element = WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located(self.combine_selectors(success_indicators))
+                )
+                success_found = True
+                self.logger.info(f"Valid login test: PASSED - Found success indicator: {element.text[:50]}")
+                self.safe_screenshot("valid_login_success")
+            except TimeoutException:
+                pass
             
             if not success_found:
                 # If no specific indicator, check if URL changed from login page
@@ -180,8 +264,6 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
             self.safe_get(self.base_url)
             self.safe_screenshot("invalid_login_before_credentials")
             
-            time.sleep(3)
-            
             # Find elements
             username_selectors = [
                 (By.ID, "username"),
@@ -212,12 +294,7 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
             
             self.safe_screenshot("invalid_login_credentials_entered")
             
-            login_button.click()
-            time.sleep(5)  # Wait for error message
-            
-            self.safe_screenshot("invalid_login_after_submit")
-            
-            # Look for error message with multiple selectors
+            # Possible error message locations
             error_selectors = [
                 (By.CLASS_NAME, "error"),
                 (By.CLASS_NAME, "error-message"),
@@ -228,6 +305,21 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
                 (By.XPATH, "//*[contains(@class, 'text-red')]")
             ]
             
+            self.wait.until(EC.element_to_be_clickable(login_button))
+            login_button.click()
+            
+            # Wait for any error message to become visible (a hidden first match
+            # must not hold the wait open while another error is shown)
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    EC.visibility_of_any_elements_located(self.combine_selectors(error_selectors))
+                )
+            except TimeoutException:
+                pass
+            
+            self.safe_screenshot("invalid_login_after_submit")
+            
+            # Look for error message with multiple selectors
             error_found = False
             for by, value in error_selectors:
                 try:
@@ -253,7 +345,6 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
         """Test login attempt with empty fields"""
         try:
             self.safe_get(self.base_url)
-            time.sleep(3)
             
             # Find login button
             button_selectors = [
@@ -263,11 +354,8 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
             ]
             
             login_button = self.find_element_with_fallback(button_selectors)
-            login_button.click()
             
-            time.sleep(3)  # Wait for validation
-            
-            # Look for validation errors with multiple selectors
+            # Possible validation error locations
             validation_selectors = [
                 (By.CLASS_NAME, "field-error"),
                 (By.CLASS_NAME, "error"),
@@ -277,6 +365,22 @@ class TestLoginPageAIEnhanced(unittest.TestCase):
                 (By.XPATH, "//input[@required]/following-sibling::*[contains(@class, 'error')]")
             ]
             
+            # A disabled button is itself the validation we are looking for,
+            # so only wait for it to be visible rather than clickable
+            WebDriverWait(self.driver, 3).until(EC.visibility_of(login_button))
+            if login_button.is_enabled():
+                login_button.click()
+                
+                # Wait for validation messages to be shown; pre-rendered hidden
+                # error nodes are present before the click, so presence isn't enough
+                try:
+                    WebDriverWait(self.driver, 3).until(
+                        EC.visibility_of_any_elements_located(self.combine_selectors(validation_selectors))
+                    )
+                except TimeoutException:
+                    pass
+            
+            # Look for validation errors with multiple selectors
             validation_errors = []
             for by, value in validation_selectors:
                 try:
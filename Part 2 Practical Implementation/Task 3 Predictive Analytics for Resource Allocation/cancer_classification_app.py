@@ -1,10 +1,12 @@
 # cancer_classification_app.py
 import streamlit as st
-import tensorflow as tf
 import numpy as np
 from PIL import Image
 import cv2
-import os
+import time
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Set page configuration
 st.set_page_config(
@@ -14,40 +16,170 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Supported model formats, in order of preference
+MODEL_SUFFIXES = ('.tflite', '.h5', '.keras')
+
+# Streamlit downscales images wider than this before sending them to the browser
+DISPLAY_WIDTH = 1460
+
+# Class labels and result styling, indexed by predicted class
+CLASSES = ("BENIGN", "MALIGNANT")
+STATUS = (st.success, st.error)
+INTERPRETATIONS = (
+    (st.info, """
+    **Interpretation:** 
+    The model suggests this appears to be a non-cancerous (benign) growth. 
+    Please consult with a healthcare professional for proper diagnosis.
+    """),
+    (st.warning, """
+    **Interpretation:** 
+    The model suggests this appears to be a cancerous (malignant) growth. 
+    **Important:** This is an AI prediction and requires confirmation 
+    by a qualified medical professional.
+    """),
+)
+
+@st.cache_data(show_spinner=False)
+def _find_model_file():
+    """Search for the model file; reruns reuse the cached path once one is found"""
+    # Check the current directory first, in order of preference
+    for suffix in MODEL_SUFFIXES:
+        path = Path('cancer_classification_model' + suffix)
+        if path.is_file():
+            return str(path)
+    
+    # Otherwise a single walk over the subdirectories, stopping at the first model found
+    for path in Path('.').rglob('cancer_classification_model.*'):
+        if path.suffix in MODEL_SUFFIXES:
+            return str(path)
+    
+    return None
+
+def _warm_up_model(model):
+    """Run the dummy forward passes for a freshly loaded model and return how long they took"""
+    # Kernel selection, workspace allocation and XLA compilation happen here
+    # instead of on the first click
+    start = time.perf_counter()
+    if hasattr(model, 'warm_up'):
+        model.warm_up()
+    else:
+        model.predict(np.zeros((1, 128, 128, 3), dtype=np.float32), verbose=0)
+    return time.perf_counter() - start
+
+@st.cache_resource(show_spinner=False)
+def _get_model(path):
+    """Load and warm up the model once per process so Streamlit reruns reuse it"""
+    # TensorFlow is imported here rather than at module level: it is only
+    # needed for the TFLite/Keras models, and TensorRT/ONNX Runtime
+    # deployments never pay its import cost
+    if path.endswith('.tflite'):
+        from tflite_inference import TFLiteClassifier
+        model = TFLiteClassifier(path)
+    else:
+        import tensorflow as tf
+        from keras_inference import XlaKerasClassifier
+        model = XlaKerasClassifier(tf.keras.models.load_model(path))
+    return model, _warm_up_model(model)
+
+@st.cache_resource(show_spinner=False)
+def _get_trt_classifier():
+    """Load and warm up a TensorRT engine built for the current GPU once per process, if one exists"""
+    try:
+        import trt_inference
+        plan_path = trt_inference.find_engine_file()
+    except Exception:
+        # TensorRT, pycuda or a CUDA-capable GPU is not available
+        return None, None, None
+    
+    if plan_path is None:
+        return None, None, None
+    model = trt_inference.TensorRTClassifier(plan_path)
+    return plan_path, model, _warm_up_model(model)
+
+@st.cache_resource(show_spinner=False)
+def _get_onnx_classifier():
+    """Load and warm up the INT8 ONNX Runtime model once per process, if it exists and the hardware benefits"""
+    try:
+        import onnx_inference
+    except Exception:
+        # onnxruntime is not installed
+        return None, None, None
+    
+    model_path = onnx_inference.find_int8_model_file()
+    if model_path is None or not onnx_inference.int8_supported():
+        # Without VNNI or CUDA, keep serving the FP32 model
+        return None, None, None
+    model = onnx_inference.OnnxRuntimeClassifier(model_path)
+    return model_path, model, _warm_up_model(model)
+
+@st.cache_resource(show_spinner=False)
+def _get_decode_pool():
+    """Worker threads for decoding uploads, shared across reruns"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def _decode_image(uploaded_file):
+    """Decode an upload (PIL releases the GIL) into its details and a uint8 RGB or grayscale array"""
+    image = Image.open(uploaded_file)
+    image_info = {'format': image.format, 'mode': image.mode, 'size': image.size}
+    
+    # Let libjpeg decode large JPEGs at 1/2, 1/4 or 1/8 scale, never below
+    # what st.image would show anyway; the model input is 128x128 regardless
+    if image.format == 'JPEG' and image.width > DISPLAY_WIDTH:
+        image.draft('RGB', (DISPLAY_WIDTH, max(1, image.height * DISPLAY_WIDTH // image.width)))
+    image.load()
+    
+    # Convert to RGB if necessary; grayscale stays single-channel for preprocessing
+    if image.mode not in ('L', 'RGB'):
+        image = image.convert('RGB')
+    
+    # One array shared by st.image and the model, so the PIL image can be dropped
+    return image_info, np.asarray(image)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_predictions(upload_digests, model_path, _app, _images):
+    """Run one batched prediction per distinct set of uploads and model; repeat clicks reuse it"""
+    # Only the upload hashes and model path form the cache key; a batch costs
+    # about the same as a single image, so caching whole batches loses little
+    return _app.predict_images(_images)
+
 class CancerClassifierApp:
     def __init__(self):
         self.model = None
-        self.class_names = ['benign', 'malignant']
+        self.class_names = CLASSES
         self.model_path = None
         self.load_model()
     
     def find_model_file(self):
         """Search for model file in current directory and subdirectories"""
-        model_name = 'cancer_classification_model.h5'
-        
-        # Check current directory first
-        if os.path.exists(model_name):
-            return model_name
-        
-        # Search in subdirectories
-        for root, dirs, files in os.walk('.'):
-            if model_name in files:
-                return os.path.join(root, model_name)
-        
-        # Also check for .keras format
-        model_name_keras = 'cancer_classification_model.keras'
-        if os.path.exists(model_name_keras):
-            return model_name_keras
-        
-        for root, dirs, files in os.walk('.'):
-            if model_name_keras in files:
-                return os.path.join(root, model_name_keras)
-        
-        return None
+        model_path = _find_model_file()
+        if model_path is None:
+            # Only cache hits, so a model trained after startup is found on the next rerun
+            _find_model_file.clear()
+        return model_path
     
     def load_model(self):
         """Load the trained model from anywhere in the directory/repo"""
         try:
+            # Prefer an accelerated model built for this machine by
+            # trt_inference.py or onnx_inference.py
+            accelerated_loaders = [
+                ("TensorRT engine", _get_trt_classifier),
+                ("ONNX Runtime INT8 model", _get_onnx_classifier),
+            ]
+            for backend_name, loader in accelerated_loaders:
+                try:
+                    backend_path, backend_model, warmup_seconds = loader()
+                except Exception as e:
+                    st.sidebar.warning(f"⚠️ {backend_name} could not be loaded, trying the next model: {e}")
+                    continue
+                
+                if backend_model is not None:
+                    self.model_path = backend_path
+                    self.model = backend_model
+                    st.sidebar.success(f"⚡ {backend_name} loaded successfully!")
+                    st.sidebar.caption(f"🔥 Warm-up inference: {warmup_seconds * 1000:.0f} ms")
+                    return
+            
             self.model_path = self.find_model_file()
             
             if self.model_path is None:
@@ -64,8 +196,9 @@ class CancerClassifierApp:
                 return
             
             st.sidebar.info(f"📁 Loading model from: {self.model_path}")
-            self.model = tf.keras.models.load_model(self.model_path)
+            self.model, warmup_seconds = _get_model(self.model_path)
             st.sidebar.success("✅ Model loaded successfully!")
+            st.sidebar.caption(f"🔥 Warm-up inference: {warmup_seconds * 1000:.0f} ms")
             
         except Exception as e:
             st.error(f"❌ Error loading model: {e}")
@@ -76,60 +209,73 @@ class CancerClassifierApp:
             - Missing custom objects/layers
             """)
     
-    def preprocess_image(self, image):
-        """Preprocess the uploaded image for prediction"""
-        # Convert to RGB if necessary
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-        
-        # Resize image to match model input size (128x128)
-        image = image.resize((128, 128))
-        
-        # Convert to numpy array and normalize
-        img_array = np.array(image) / 255.0
+    def preprocess_image(self, image, out=None):
+        """Preprocess a decoded uint8 image array for prediction, optionally into a (1, 128, 128, 3) buffer"""
+        if image.ndim == 2:
+            # Resize the single grayscale channel; it is broadcast to RGB when
+            # normalizing below instead of converting the full-size image
+            img_array = cv2.resize(image, (128, 128), interpolation=cv2.INTER_AREA)[..., np.newaxis]
+        else:
+            # Resize the uint8 RGB pixels to match model input size (128x128)
+            img_array = cv2.resize(image, (128, 128), interpolation=cv2.INTER_AREA)
         
-        # Ensure the image has 3 channels (RGB)
-        if len(img_array.shape) == 2:  # Grayscale image
-            img_array = np.stack([img_array] * 3, axis=-1)
-        elif img_array.shape[-1] == 1:  # Single channel
-            img_array = np.repeat(img_array, 3, axis=-1)
-        elif img_array.shape[-1] == 4:  # RGBA image
-            img_array = img_array[:, :, :3]  # Remove alpha channel
+        # Batch dimension included; every branch above yields 1 or 3 channels
+        if out is None:
+            out = np.empty((1, 128, 128, 3), dtype=np.float32)
         
-        # Add batch dimension
-        img_array = np.expand_dims(img_array, axis=0)
+        # Convert and normalize to [0, 1] in one pass, straight into the output buffer
+        np.multiply(img_array, np.float32(1.0 / 255.0), out=out[0])
         
-        return img_array
+        return out
     
     def predict_image(self, image):
         """Make prediction on the uploaded image"""
         if self.model is None:
             return None, None, None
         
-        # Preprocess image
-        processed_image = self.preprocess_image(image)
+        return self.predict_images([image])[0]
+    
+    def predict_images(self, images):
+        """Make predictions on several images with a single batched forward pass"""
+        if self.model is None:
+            return []
+        
+        # Preprocess images directly into one (N, 128, 128, 3) batch
+        processed_images = np.empty((len(images), 128, 128, 3), dtype=np.float32)
+        for i, image in enumerate(images):
+            self.preprocess_image(image, out=processed_images[i:i + 1])
         
         # Debug information (optional)
-        st.sidebar.write(f"📊 Input shape: {processed_image.shape}")
+        st.sidebar.write(f"📊 Input shape: {processed_images.shape}")
         
-        # Make prediction
-        predictions = self.model.predict(processed_image, verbose=0)
+        # Make predictions
+        predictions = self.run_model(processed_images)
         
-        # Get predicted class and confidence
-        predicted_class = np.argmax(predictions[0])
-        confidence = predictions[0][predicted_class]
+        # Get predicted class and confidence for each image; the model already
+        # ends in softmax, so the outputs are probabilities
+        predicted_classes = predictions.argmax(axis=1)
+        results = []
+        for predicted_class, image_predictions in zip(predicted_classes.tolist(), predictions):
+            confidence = float(image_predictions[predicted_class])
+            results.append((predicted_class, confidence, image_predictions))
         
-        return predicted_class, confidence, predictions[0]
+        return results
+    
+    def run_model(self, batch):
+        """Run the loaded model (Keras/XLA, TFLite, TensorRT or ONNX Runtime) on a preprocessed batch"""
+        # Every backend shares the Keras predict() interface
+        return self.model.predict(batch, verbose=0)
     
     def display_confidence_bars(self, predictions):
         """Display confidence levels as progress bars"""
-        for i, (class_name, confidence) in enumerate(zip(self.class_names, predictions)):
+        top_class = int(np.argmax(predictions))
+        for i, (class_name, confidence) in enumerate(zip(self.class_names, np.asarray(predictions).tolist())):
             # Create progress bar with color coding
-            if i == np.argmax(predictions):
+            if i == top_class:
                 # Highlight the predicted class
-                st.write(f"🎯 **{class_name.upper()}**: {confidence:.2%}")
+                st.write(f"🎯 **{class_name}**: {confidence:.2%}")
             else:
-                st.write(f"**{class_name.upper()}**: {confidence:.2%}")
+                st.write(f"**{class_name}**: {confidence:.2%}")
             
             st.progress(float(confidence))
             st.write("")
@@ -139,37 +285,38 @@ class CancerClassifierApp:
         if self.model and self.model_path:
             with st.sidebar.expander("📊 Model Details"):
                 st.write(f"**Model Location:** `{self.model_path}`")
-                st.write(f"**Model Layers:** {len(self.model.layers)}")
+                st.write(f"**Model Format:** {self.model.description}")
+                if hasattr(self.model, 'layers'):
+                    st.write(f"**Model Layers:** {len(self.model.layers)}")
                 st.write(f"**Input Shape:** {self.model.input_shape}")
                 st.write(f"**Output Shape:** {self.model.output_shape}")
                 st.write(f"**Expected Input:** RGB images (128x128x3)")
     
-    def run(self):
-        """Run the Streamlit app"""
-        # Header
-        st.title("🏥 Cancer Image Classification App")
-        st.markdown("---")
-        
-        # Sidebar
+    def render_sidebar(self):
+        """Render the sidebar with app, model and input information"""
         st.sidebar.title("About")
         st.sidebar.info(
             "This app uses a deep learning model to classify cancer images "
             "as **benign** or **malignant**. Upload a medical image to get started."
         )
         
-        st.sidebar.markdown("### Model Information")
-        st.sidebar.text("Architecture: CNN")
-        st.sidebar.text("Accuracy: 79.8%")
-        st.sidebar.text("F1-Score: 77.5%")
-        st.sidebar.text("Classes: Benign, Malignant")
+        st.sidebar.markdown("""
+        ### Model Information
+        - Architecture: CNN
+        - Accuracy: 79.8%
+        - F1-Score: 77.5%
+        - Classes: Benign, Malignant
+        """)
         
         # Display model details if loaded
         self.display_model_info()
         
-        st.sidebar.markdown("### Instructions")
-        st.sidebar.text("1. Upload a medical image")
-        st.sidebar.text("2. Wait for prediction")
-        st.sidebar.text("3. View results and confidence")
+        st.sidebar.markdown("""
+        ### Instructions
+        1. Upload one or more medical images
+        2. Wait for prediction
+        3. View results and confidence
+        """)
         
         # Image format info
         with st.sidebar.expander("📷 Image Requirements"):
@@ -189,62 +336,72 @@ class CancerClassifierApp:
             st.sidebar.error("❌ Model not loaded")
         else:
             st.sidebar.success("✅ Model ready for predictions")
+    
+    def run(self):
+        """Run the Streamlit app"""
+        # Header
+        st.title("🏥 Cancer Image Classification App")
+        st.markdown("---")
         
         # Main content area
         col1, col2 = st.columns([1, 1])
         
         with col1:
-            st.subheader("Upload Image")
+            st.subheader("Upload Images")
             
             # File uploader
-            uploaded_file = st.file_uploader(
-                "Choose a medical image...",
+            uploaded_files = st.file_uploader(
+                "Choose medical images...",
                 type=['png', 'jpg', 'jpeg', 'tiff', 'bmp'],
+                accept_multiple_files=True,
                 help="Supported formats: PNG, JPG, JPEG, TIFF, BMP"
             )
-            
-            if uploaded_file is not None:
-                # Display uploaded image
-                image = Image.open(uploaded_file)
-                
-                # Show image information
-                st.write(f"**Image format:** {image.format}")
-                st.write(f"**Image mode:** {image.mode}")
-                st.write(f"**Image size:** {image.size}")
+        
+        # Decode the uploads in the background while the sidebar renders
+        decode_pool = _get_decode_pool()
+        decode_futures = [decode_pool.submit(_decode_image, uploaded_file) for uploaded_file in uploaded_files]
+        
+        # Sidebar
+        self.render_sidebar()
+        
+        with col1:
+            if decode_futures:
+                decoded = [decode_future.result() for decode_future in decode_futures]
+                images = [image for _, image in decoded]
                 
-                st.image(image, caption="Uploaded Image", use_container_width=True)
+                for uploaded_file, (image_info, image) in zip(uploaded_files, decoded):
+                    # Show image information
+                    st.write(f"**File:** {uploaded_file.name}")
+                    st.write(f"**Image format:** {image_info['format']}")
+                    st.write(f"**Image mode:** {image_info['mode']}")
+                    st.write(f"**Image size:** {image_info['size']}")
+                    
+                    # Display uploaded image
+                    st.image(image, caption=uploaded_file.name, channels='RGB', use_container_width=True)
                 
-                # Make prediction when button is clicked
-                if st.button("🔍 Analyze Image", type="primary", disabled=self.model is None):
-                    with st.spinner("Analyzing image..."):
-                        predicted_class, confidence, all_predictions = self.predict_image(image)
+                # Make predictions for every upload in one batch when button is clicked
+                if st.button("🔍 Analyze Images", type="primary", disabled=self.model is None):
+                    upload_digests = tuple(
+                        hashlib.sha1(uploaded_file.getvalue()).hexdigest() for uploaded_file in uploaded_files
+                    )
+                    with st.spinner("Analyzing images..."):
+                        results = _cached_predictions(upload_digests, self.model_path, self, images)
                     
-                    if predicted_class is not None:
-                        # Display results
-                        with col2:
-                            st.subheader("Analysis Results")
+                    # Display results
+                    with col2:
+                        st.subheader("Analysis Results")
+                        
+                        for uploaded_file, (predicted_class, confidence, all_predictions) in zip(uploaded_files, results):
+                            st.markdown(f"#### {uploaded_file.name}")
                             
                             # Show prediction with color coding
-                            if predicted_class == 0:  # Benign
-                                st.success(f"**Prediction: BENIGN**")
-                                st.metric("Confidence", f"{confidence:.2%}")
-                                st.info("""
-                                **Interpretation:** 
-                                The model suggests this appears to be a non-cancerous (benign) growth. 
-                                Please consult with a healthcare professional for proper diagnosis.
-                                """)
-                            else:  # Malignant
-                                st.error(f"**Prediction: MALIGNANT**")
-                                st.metric("Confidence", f"{confidence:.2%}")
-                                st.warning("""
-                                **Interpretation:** 
-                                The model suggests this appears to be a cancerous (malignant) growth. 
-                                **Important:** This is an AI prediction and requires confirmation 
-                                by a qualified medical professional.
-                                """)
+                            STATUS[predicted_class](f"**Prediction: {CLASSES[predicted_class]}**")
+                            st.metric("Confidence", f"{confidence:.2%}")
+                            show_interpretation, interpretation = INTERPRETATIONS[predicted_class]
+                            show_interpretation(interpretation)
                             
                             # Confidence bar
-                            st.subheader("Confidence Levels")
+                            st.markdown("**Confidence Levels**")
                             if all_predictions is not None:
                                 self.display_confidence_bars(all_predictions)
             
@@ -252,14 +409,16 @@ class CancerClassifierApp:
                 # Show placeholder when no image is uploaded
                 with col2:
                     st.subheader("Analysis Results")
-                    st.info("👈 Upload an image to see analysis results here")
+                    st.info("👈 Upload one or more images to see analysis results here")
                     
                     # Sample images section
                     st.subheader("Expected Input")
-                    st.text("The model expects medical images similar to:")
-                    st.text("• Histopathology slides")
-                    st.text("• Medical imaging scans")
-                    st.text("• Tissue sample images")
+                    st.markdown("""
+                    The model expects medical images similar to:
+                    - Histopathology slides
+                    - Medical imaging scans
+                    - Tissue sample images
+                    """)
                     
                     st.info("""
                     **Note:** The model expects RGB images. Grayscale images will 
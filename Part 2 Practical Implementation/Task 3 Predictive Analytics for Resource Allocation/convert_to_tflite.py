@@ -0,0 +1,38 @@
+# convert_to_tflite.py
+import tensorflow as tf
+import os
+
+KERAS_MODEL_PATH = 'cancer_classification_model.h5'
+TFLITE_MODEL_PATH = 'cancer_classification_model.tflite'
+
+def convert_model(keras_path=KERAS_MODEL_PATH, tflite_path=TFLITE_MODEL_PATH):
+    """
+    Convert the trained Keras model to a quantized TensorFlow Lite model
+
+    Uses post-training dynamic-range quantization: weights are stored as
+    int8 while inputs and outputs stay float32, so the app can feed it the
+    same preprocessed images as the Keras model.
+
+    Parameters:
+    keras_path (str): Path to the trained .h5/.keras model
+    tflite_path (str): Where to write the .tflite model
+
+    Returns:
+    str: Path of the written .tflite model
+    """
+    model = tf.keras.models.load_model(keras_path)
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    tflite_model = converter.convert()
+
+    with open(tflite_path, 'wb') as f:
+        f.write(tflite_model)
+
+    print(f"Keras model size:  {os.path.getsize(keras_path) / 1e6:.2f} MB")
+    print(f"TFLite model size: {os.path.getsize(tflite_path) / 1e6:.2f} MB")
+    return tflite_path
+
+if __name__ == "__main__":
+    path = convert_model()
+    print(f"✅ Quantized model saved to: {path}")
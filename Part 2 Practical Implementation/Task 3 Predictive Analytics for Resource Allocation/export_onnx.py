@@ -0,0 +1,28 @@
+# export_onnx.py
+import tensorflow as tf
+import tf2onnx
+
+KERAS_MODEL_PATH = 'cancer_classification_model.h5'
+ONNX_MODEL_PATH = 'cancer_classification_model.onnx'
+INPUT_NAME = 'input'
+
+def export_model(keras_path=KERAS_MODEL_PATH, onnx_path=ONNX_MODEL_PATH):
+    """
+    Export the trained Keras model to ONNX with a dynamic batch dimension
+
+    Parameters:
+    keras_path (str): Path to the trained .h5/.keras model
+    onnx_path (str): Where to write the .onnx model
+
+    Returns:
+    str: Path of the written .onnx model
+    """
+    model = tf.keras.models.load_model(keras_path)
+
+    input_signature = (tf.TensorSpec((None, 128, 128, 3), tf.float32, name=INPUT_NAME),)
+    tf2onnx.convert.from_keras(model, input_signature=input_signature, output_path=onnx_path)
+    return onnx_path
+
+if __name__ == "__main__":
+    path = export_model()
+    print(f"✅ ONNX model saved to: {path}")
@@ -0,0 +1,59 @@
+# keras_inference.py
+"""
+XLA-compiled backend for the Keras (.h5/.keras) cancer classifier.
+
+The forward pass is wrapped in a tf.function with jit_compile=True so XLA
+fuses the conv/activation chains. XLA compiles once per input shape, so
+batches are zero-padded to a few fixed sizes that warm_up() compiles when
+the app loads the model, never while a user waits on Analyze.
+"""
+import numpy as np
+import tensorflow as tf
+
+# Batch sizes compiled up front; larger uploads run in chunks of the last one
+BATCH_SIZES = (1, 4, 8, 16)
+
+class XlaKerasClassifier:
+    """Runs a Keras model through XLA with the same predict() call as a Keras model"""
+
+    description = "Keras (XLA-compiled)"
+
+    def __init__(self, model):
+        self.model = model
+        self.layers = model.layers
+        self.input_shape = model.input_shape
+        self.output_shape = model.output_shape
+        self.input_signature = [tf.TensorSpec((None, *model.input_shape[1:]), tf.float32)]
+        self.infer = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=self.input_signature,
+            jit_compile=True
+        )
+
+    def warm_up(self):
+        """Compile every padded batch size, falling back to the plain graph if XLA is unavailable"""
+        try:
+            # Zeros are always valid input, so a failure here means XLA
+            # itself is unavailable
+            for batch_size in BATCH_SIZES:
+                self.infer(tf.zeros((batch_size, *self.input_shape[1:])))
+        except tf.errors.OpError:
+            # XLA is not available for this device/build; use the plain graph
+            self.infer = tf.function(
+                lambda x: self.model(x, training=False),
+                input_signature=self.input_signature
+            )
+            self.infer(tf.zeros((1, *self.input_shape[1:])))
+
+    def predict(self, batch, verbose=0):
+        """Run inference on a preprocessed (N, 128, 128, 3) float32 batch"""
+        outputs = []
+        max_batch_size = BATCH_SIZES[-1]
+        for start in range(0, len(batch), max_batch_size):
+            chunk = batch[start:start + max_batch_size]
+            # Pad up to the nearest compiled size so XLA never recompiles
+            padded_size = next(size for size in BATCH_SIZES if size >= len(chunk))
+            padded = np.zeros((padded_size, *chunk.shape[1:]), dtype=np.float32)
+            padded[:len(chunk)] = chunk
+            outputs.append(self.infer(tf.constant(padded)).numpy()[:len(chunk)])
+        return np.concatenate(outputs, axis=0)
@@ -0,0 +1,59 @@
+# onnx_inference.py
+"""
+Optional ONNX Runtime INT8 backend for the cancer classifier.
+
+Quantize once, calibrating on a sample of the training images:
+    python export_onnx.py
+    python quantize_onnx.py [calibration_dir]
+The app uses the INT8 model when the CPU supports VNNI (or a CUDA execution
+provider is available) and falls back to the TFLite/Keras model otherwise.
+"""
+from pathlib import Path
+
+import numpy as np
+import onnxruntime as ort
+
+INT8_MODEL_PATH = 'cancer_classification_model_int8.onnx'
+
+def cpu_has_vnni():
+    """Check whether the CPU has int8 dot-product (VNNI) instructions"""
+    try:
+        import cpuinfo
+    except ImportError:
+        return False
+    flags = cpuinfo.get_cpu_info().get('flags', [])
+    return any(flag in flags for flag in ('avx512_vnni', 'avx512vnni', 'avx_vnni'))
+
+def int8_supported():
+    """INT8 pays off on VNNI CPUs or when ONNX Runtime can run on CUDA"""
+    return cpu_has_vnni() or 'CUDAExecutionProvider' in ort.get_available_providers()
+
+def find_int8_model_file():
+    """Search for the quantized model in current directory and subdirectories"""
+    for path in Path('.').rglob(INT8_MODEL_PATH):
+        return str(path)
+    return None
+
+class OnnxRuntimeClassifier:
+    """Runs an ONNX model with the same predict() call as a Keras model"""
+
+    description = "ONNX Runtime (INT8)"
+
+    def __init__(self, model_path):
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        available = ort.get_available_providers()
+        providers = [p for p in ('CUDAExecutionProvider', 'CPUExecutionProvider') if p in available]
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=providers)
+
+        model_input = self.session.get_inputs()[0]
+        model_output = self.session.get_outputs()[0]
+        self.input_name = model_input.name
+        # Symbolic (dynamic) dimensions are reported as strings
+        self.input_shape = tuple(d if isinstance(d, int) else None for d in model_input.shape)
+        self.output_shape = tuple(d if isinstance(d, int) else None for d in model_output.shape)
+
+    def predict(self, batch, verbose=0):
+        """Run inference on a preprocessed (N, 128, 128, 3) float32 batch"""
+        batch = np.ascontiguousarray(batch, dtype=np.float32)
+        return self.session.run(None, {self.input_name: batch})[0]
@@ -0,0 +1,80 @@
+# quantize_onnx.py
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import onnxruntime as ort
+from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+from onnxruntime.quantization.shape_inference import quant_pre_process
+from PIL import Image
+
+from onnx_inference import INT8_MODEL_PATH
+
+ONNX_MODEL_PATH = 'cancer_classification_model.onnx'
+CALIBRATION_DIR = 'cancer_extracted'
+NUM_CALIBRATION_IMAGES = 100
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tiff', '.bmp')
+
+class ImageCalibrationReader(CalibrationDataReader):
+    """Feeds preprocessed training images to the static quantizer"""
+
+    def __init__(self, image_dir, input_name, num_images=NUM_CALIBRATION_IMAGES):
+        image_paths = sorted(p for p in Path(image_dir).rglob('*') if p.suffix.lower() in IMAGE_EXTENSIONS)
+        if not image_paths:
+            raise FileNotFoundError(f"No calibration images found in {image_dir}")
+        random.Random(42).shuffle(image_paths)
+        self.image_paths = iter(image_paths[:num_images])
+        self.input_name = input_name
+
+    def get_next(self):
+        image_path = next(self.image_paths, None)
+        if image_path is None:
+            return None
+
+        # Same preprocessing as the training notebook
+        img = Image.open(image_path)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        img = img.resize((128, 128))
+        img_array = np.asarray(img, dtype=np.float32) * (1.0 / 255.0)
+        return {self.input_name: img_array[np.newaxis, ...]}
+
+def quantize_model(onnx_path=ONNX_MODEL_PATH, int8_path=INT8_MODEL_PATH,
+                   calibration_dir=CALIBRATION_DIR, num_images=NUM_CALIBRATION_IMAGES):
+    """
+    Apply static INT8 post-training quantization to the exported ONNX model
+
+    Parameters:
+    onnx_path (str): Path to the FP32 model written by export_onnx.py
+    int8_path (str): Where to write the quantized model
+    calibration_dir (str): Directory searched recursively for calibration images
+    num_images (int): Number of calibration images to use
+
+    Returns:
+    str: Path of the written INT8 model
+    """
+    input_name = ort.InferenceSession(onnx_path, providers=['CPUExecutionProvider']).get_inputs()[0].name
+    reader = ImageCalibrationReader(calibration_dir, input_name, num_images)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Shape inference and graph cleanup give the quantizer a complete graph
+        preprocessed_path = os.path.join(tmp_dir, 'preprocessed.onnx')
+        quant_pre_process(onnx_path, preprocessed_path, skip_symbolic_shape=True)
+        quantize_static(
+            preprocessed_path,
+            int8_path,
+            reader,
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=True
+        )
+    return int8_path
+
+if __name__ == "__main__":
+    calibration_dir = sys.argv[1] if len(sys.argv) > 1 else CALIBRATION_DIR
+    path = quantize_model(calibration_dir=calibration_dir)
+    print(f"✅ INT8 model saved to: {path}")
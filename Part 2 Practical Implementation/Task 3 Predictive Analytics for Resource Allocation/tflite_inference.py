@@ -0,0 +1,40 @@
+# tflite_inference.py
+"""
+TensorFlow Lite backend for the cancer classifier.
+
+Create the quantized model once with:
+    python convert_to_tflite.py
+"""
+import threading
+
+import tensorflow as tf
+
+class TFLiteClassifier:
+    """Runs a .tflite model with the same predict() call as a Keras model"""
+
+    description = "TensorFlow Lite (quantized)"
+
+    def __init__(self, model_path):
+        self.interpreter = tf.lite.Interpreter(model_path=model_path)
+        self.interpreter.allocate_tensors()
+        # One cached interpreter serves every Streamlit session and it is not
+        # thread-safe; the lock lives on the instance so it is cached with it
+        self.lock = threading.Lock()
+
+        input_details = self.interpreter.get_input_details()[0]
+        output_details = self.interpreter.get_output_details()[0]
+        self.input_shape = (None, *input_details['shape'][1:].tolist())
+        self.output_shape = (None, *output_details['shape'][1:].tolist())
+
+    def predict(self, batch, verbose=0):
+        """Run inference on a preprocessed (N, 128, 128, 3) float32 batch"""
+        with self.lock:
+            # The converted model is built for batch size 1; resize for larger batches
+            input_details = self.interpreter.get_input_details()[0]
+            if tuple(input_details['shape']) != batch.shape:
+                self.interpreter.resize_tensor_input(input_details['index'], batch.shape)
+                self.interpreter.allocate_tensors()
+            output_details = self.interpreter.get_output_details()[0]
+            self.interpreter.set_tensor(input_details['index'], batch.astype(input_details['dtype']))
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(output_details['index'])
@@ -0,0 +1,152 @@
+# trt_inference.py
+"""
+Optional TensorRT backend for the cancer classifier.
+
+Build an engine once per GPU architecture with:
+    python export_onnx.py
+    python trt_inference.py
+The app picks up the engine for the current GPU automatically and falls
+back to the TFLite/Keras model when TensorRT, pycuda or a GPU is missing.
+"""
+import threading
+from pathlib import Path
+
+import numpy as np
+import tensorrt as trt
+import pycuda.driver as cuda
+
+ONNX_MODEL_PATH = 'cancer_classification_model.onnx'
+ENGINE_PREFIX = 'cancer_classification_model'
+OPT_BATCH_SIZE = 8
+MAX_BATCH_SIZE = 16
+
+TRT_LOGGER = trt.Logger(trt.Logger.WARNING)
+
+cuda.init()
+
+def gpu_arch(device_id=0):
+    """Return the compute capability of the GPU as e.g. 'sm_86'"""
+    major, minor = cuda.Device(device_id).compute_capability()
+    return f"sm_{major}{minor}"
+
+def engine_file_name(arch=None):
+    """Engines are tied to the GPU they were built on, so the name carries the arch"""
+    return f"{ENGINE_PREFIX}_{arch or gpu_arch()}.plan"
+
+def find_engine_file():
+    """Search for an engine built for the current GPU"""
+    for path in Path('.').rglob(engine_file_name()):
+        return str(path)
+    return None
+
+def build_trt_engine(onnx_path=ONNX_MODEL_PATH, plan_path=None, max_batch_size=MAX_BATCH_SIZE):
+    """
+    Build and serialize an FP16 TensorRT engine from the exported ONNX model
+
+    Parameters:
+    onnx_path (str): Path to the model written by export_onnx.py
+    plan_path (str): Where to write the engine (defaults to the GPU-specific name)
+    max_batch_size (int): Largest batch the engine accepts
+
+    Returns:
+    str: Path of the written engine
+    """
+    plan_path = plan_path or engine_file_name()
+
+    builder = trt.Builder(TRT_LOGGER)
+    network = builder.create_network(0)
+    parser = trt.OnnxParser(network, TRT_LOGGER)
+    with open(onnx_path, 'rb') as f:
+        if not parser.parse(f.read()):
+            errors = [str(parser.get_error(i)) for i in range(parser.num_errors)]
+            raise RuntimeError(f"Could not parse {onnx_path}: {errors}")
+
+    config = builder.create_builder_config()
+    if builder.platform_has_fast_fp16:
+        config.set_flag(trt.BuilderFlag.FP16)
+
+    # The ONNX export has a dynamic batch dimension; tune kernels for a
+    # typical multi-image upload while still accepting 1..max_batch_size
+    input_tensor = network.get_input(0)
+    image_shape = tuple(input_tensor.shape[1:])
+    profile = builder.create_optimization_profile()
+    profile.set_shape(
+        input_tensor.name,
+        (1, *image_shape),
+        (min(OPT_BATCH_SIZE, max_batch_size), *image_shape),
+        (max_batch_size, *image_shape)
+    )
+    config.add_optimization_profile(profile)
+
+    serialized_engine = builder.build_serialized_network(network, config)
+    if serialized_engine is None:
+        raise RuntimeError("TensorRT engine build failed")
+
+    with open(plan_path, 'wb') as f:
+        f.write(serialized_engine)
+    return plan_path
+
+class TensorRTClassifier:
+    """Runs a serialized TensorRT engine with the same predict() call as a Keras model"""
+
+    description = "TensorRT engine (FP16)"
+
+    def __init__(self, plan_path, device_id=0):
+        # Streamlit serves sessions from several threads, so own the CUDA
+        # context explicitly and make it current around every call
+        self.cuda_context = cuda.Device(device_id).make_context()
+        self.lock = threading.Lock()
+        try:
+            runtime = trt.Runtime(TRT_LOGGER)
+            with open(plan_path, 'rb') as f:
+                self.engine = runtime.deserialize_cuda_engine(f.read())
+            if self.engine is None:
+                raise RuntimeError(f"Could not deserialize TensorRT engine: {plan_path}")
+            self.context = self.engine.create_execution_context()
+            self.stream = cuda.Stream()
+
+            names = [self.engine.get_tensor_name(i) for i in range(self.engine.num_io_tensors)]
+            self.input_name = next(n for n in names if self.engine.get_tensor_mode(n) == trt.TensorIOMode.INPUT)
+            self.output_name = next(n for n in names if self.engine.get_tensor_mode(n) == trt.TensorIOMode.OUTPUT)
+
+            image_shape = tuple(self.engine.get_tensor_shape(self.input_name))[1:]
+            num_classes = self.engine.get_tensor_shape(self.output_name)[-1]
+            self.max_batch_size = self.engine.get_tensor_profile_shape(self.input_name, 0)[2][0]
+            self.input_shape = (None, *image_shape)
+            self.output_shape = (None, num_classes)
+
+            # Pinned host and device buffers are sized for the largest batch
+            # and reused, so host/device copies are truly asynchronous
+            self.h_input = cuda.pagelocked_empty((self.max_batch_size, *image_shape), np.float32)
+            self.d_input = cuda.mem_alloc(self.h_input.nbytes)
+            self.h_output = cuda.pagelocked_empty((self.max_batch_size, num_classes), np.float32)
+            self.d_output = cuda.mem_alloc(self.h_output.nbytes)
+            self.context.set_tensor_address(self.input_name, int(self.d_input))
+            self.context.set_tensor_address(self.output_name, int(self.d_output))
+        finally:
+            self.cuda_context.pop()
+
+    def predict(self, batch, verbose=0):
+        """Run inference on a preprocessed (N, 128, 128, 3) float32 batch"""
+        outputs = []
+        with self.lock:
+            self.cuda_context.push()
+            try:
+                for start in range(0, len(batch), self.max_batch_size):
+                    chunk = batch[start:start + self.max_batch_size]
+                    h_input = self.h_input[:len(chunk)]
+                    h_output = self.h_output[:len(chunk)]
+                    h_input[...] = chunk
+                    self.context.set_input_shape(self.input_name, chunk.shape)
+                    cuda.memcpy_htod_async(self.d_input, h_input, self.stream)
+                    self.context.execute_async_v3(self.stream.handle)
+                    cuda.memcpy_dtoh_async(h_output, self.d_output, self.stream)
+                    self.stream.synchronize()
+                    outputs.append(h_output.copy())
+            finally:
+                self.cuda_context.pop()
+        return np.concatenate(outputs, axis=0)
+
+if __name__ == "__main__":
+    path = build_trt_engine()
+    print(f"✅ TensorRT engine for {gpu_arch()} saved to: {path}")